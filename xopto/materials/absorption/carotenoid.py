@@ -20,24 +20,117 @@
 # along with PyXOpto. If not, see <https://www.gnu.org/licenses/>.
 ################################# End license ##################################
 
+from typing import Tuple
+import os
 import os.path
+import warnings
 
 import numpy as np
+import numba as nb
 
 from .base import Absorption, Interpolator
 from xopto import DATA_PATH
 
+CAROTENOID_DEBUG = bool(int(os.environ.get('PYXOPTO_DEBUG', '0') or '0'))
+'''
+Default state of the wavelength range check. Enabled by setting the
+PYXOPTO_DEBUG environment variable to a nonzero integer.
+'''
+
+@nb.jit(nopython=True, cache=True)
+def _interp_hint(x: float, xp: np.ndarray, fp: np.ndarray, hint: int) \
+        -> Tuple[float, int]:
+    '''
+    Linear interpolation of a scalar value that starts the search for the
+    interval at the interval of the previous query.
+
+    Parameters
+    ----------
+    x: float
+        Value at which to interpolate.
+    xp: np.ndarray
+        Monotonically increasing x coordinates of the data points.
+    fp: np.ndarray
+        The y coordinates of the data points.
+    hint: int
+        Index of the interval used by the previous query.
+
+    Returns
+    -------
+    y: float
+        Interpolated value. Values outside of the data range are clamped
+        to fp[0] or fp[-1].
+    index: int
+        Index of the interval that was used for interpolation. Pass this
+        value as the hint to the next query.
+    '''
+    n = xp.size
+    if x <= xp[0]:
+        return fp[0], 0
+    if x >= xp[n - 1]:
+        return fp[n - 1], n - 2
+
+    i = min(max(hint, 0), n - 2)
+    if not (xp[i] <= x <= xp[i + 1]):
+        if i + 2 < n and xp[i + 1] <= x <= xp[i + 2]:
+            i += 1
+        elif i > 0 and xp[i - 1] <= x <= xp[i]:
+            i -= 1
+        else:
+            low, high = 0, n - 1
+            while high - low > 1:
+                mid = (low + high) // 2
+                if xp[mid] <= x:
+                    low = mid
+                else:
+                    high = mid
+            i = low
+
+    dx = xp[i + 1] - xp[i]
+    if dx <= 0.0:
+        return fp[i], i
+
+    return fp[i] + (fp[i + 1] - fp[i])*(x - xp[i])/dx, i
+
+
 class Carotenoid(Absorption):
     material = 'carotenoid'
 
-    def __init__(self):
+    def __init__(self, check_range: bool = None):
+        '''
+        Absorption coefficient of carotenoid.
+
+        Parameters
+        ----------
+        check_range: bool
+            If True, report a warning when the wavelength of light is not
+            within the range of the tabulated data. Values outside of the
+            range are clamped to the first or last tabulated value.
+            If None, the value of :py:data:`CAROTENOID_DEBUG` is used.
+        '''
         super().__init__()
-        filename = os.path.join(
+        self._filename = os.path.join(
             DATA_PATH, 'materials', 'absorption', 'carotenoid_absorption.npy')
-        data = np.load(filename)
 
-        self._interpolator = Interpolator.fromfile(
-            filename, bounds_error=False, fill_value=(data[0, 1], data[-1, 1])) 
+        self._xp = self._fp = None
+        self._interpolator = None
+        if check_range is None:
+            check_range = CAROTENOID_DEBUG
+        self._check_range = bool(check_range)
+        self._last_idx = 0
+
+    def _ensure_loaded(self):
+        '''
+        Loads the tabulated absorption coefficient on the first use.
+        '''
+        if self._xp is None:
+            data = np.load(self._filename, mmap_mode='r')
+            self._xp = np.ascontiguousarray(data[:, 0], dtype=np.float64)
+            self._fp = np.ascontiguousarray(data[:, 1], dtype=np.float64)
+
+            self._interpolator = Interpolator(
+                self._xp, self._fp,
+                bounds_error=False, fill_value=(self._fp[0], self._fp[-1]))
 
     def __call__(self, wavelength: float or np.ndarray, t: float = None) \
             -> np.ndarray or float:
@@ -58,9 +151,38 @@ class Carotenoid(Absorption):
         mua: float, np.ndarray
             Absorption coefficient (1/m) at the specified wavelength (m).
         '''
-        self._interpolator.check_range(wavelength)
+        self._ensure_loaded()
+
+        if np.isscalar(wavelength):
+            wavelength = float(wavelength)
+            if self._check_range:
+                self._warn_range(wavelength, wavelength)
+            res, self._last_idx = _interp_hint(
+                wavelength, self._xp, self._fp, self._last_idx)
+            return float(res)
+
+        self._last_idx = 0
+
+        if self._check_range:
+            wavelength = np.asarray(wavelength)
+            if wavelength.size > 0:
+                self._warn_range(float(np.min(wavelength)),
+                                 float(np.max(wavelength)))
 
-        return self._interpolator(wavelength)
+        return np.interp(wavelength, self._xp, self._fp,
+                         left=self._fp[0], right=self._fp[-1])
+
+    def _warn_range(self, wmin: float, wmax: float):
+        '''
+        Reports a warning if the wavelength range [wmin, wmax] is not
+        within the range of the tabulated data.
+        '''
+        if wmin < self._xp[0] or wmax > self._xp[-1]:
+            warnings.warn(
+                'Wavelength is out of valid range '\
+                '[{:.1f}, {:.1f}] nm!'.format(
+                    self._xp[0]*1e9, self._xp[-1]*1e9)
+            )
 
     def plot(self, wavelength: np.ndarray = None, show: bool = True):
         '''
@@ -71,7 +193,20 @@ class Carotenoid(Absorption):
         wavelength: np.ndarray
             Wavelengths of light. If None, use the reference values.
         '''
+        self._ensure_loaded()
+
         self._interpolator.plot(wavelength, label=self.material, show=show)
 
 
-default = Carotenoid()
+_default = None
+
+def __getattr__(name: str):
+    # the default instance is created on the first access
+    global _default
+    if name == 'default':
+        if _default is None:
+            _default = Carotenoid()
+        return _default
+
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
@@ -20,7 +20,10 @@
 # along with PyXOpto. If not, see <https://www.gnu.org/licenses/>.
 ################################# End license ##################################
 
-from typing import List
+from typing import List, Tuple
+import ctypes
+import operator
+import struct
 
 import numpy as np
 
@@ -29,11 +32,177 @@ from xopto.mcvox import cltypes
 from xopto.mcvox import mcpf
 
 
+_MATERIAL_FIELDS = ('n', 'mus', 'mua', 'inv_mut', 'mua_inv_mut')
+''' Scalar fields of the OpenCL material structure in the declared order. '''
+
+_material_properties = operator.attrgetter(*_MATERIAL_FIELDS)
+''' Fetches the optical properties of an isotropic material as a tuple. '''
+
+_SMALL_STACK_SIZE = 16
+'''
+Material stacks with fewer materials are packed with struct.pack_into,
+which has a lower setup cost than the structured numpy view.
+'''
+
+_material_structs = {}
+''' Cache of struct.Struct instances keyed by the material numpy dtype. '''
+
+
+def _material_struct(np_dtype: np.dtype) -> struct.Struct or None:
+    '''
+    Returns a struct.Struct instance that packs the scalar fields of an
+    OpenCL material structure in one call.
+
+    Parameters
+    ----------
+    np_dtype: np.dtype
+        Structured numpy data type of the material as returned by
+        :py:func:`_material_np_dtype`.
+
+    Returns
+    -------
+    packer: struct.Struct or None
+        Packer of the n, mus, mua, inv_mut and mua_inv_mut fields or None
+        if the fields are not stored contiguously.
+    '''
+    if np_dtype not in _material_structs:
+        packer = None
+        fp_dtype, offset = np_dtype.fields['n']
+        if offset == 0 and all(
+                np_dtype.fields[name] == (fp_dtype, index*fp_dtype.itemsize)
+                for index, name in enumerate(_MATERIAL_FIELDS)):
+            packer = struct.Struct(
+                '={:d}{:s}'.format(len(_MATERIAL_FIELDS), fp_dtype.char))
+        _material_structs[np_dtype] = packer
+
+    return _material_structs[np_dtype]
+
+
+
+def _struct_np_dtype(cl_struct_type: cltypes.Structure) -> np.dtype or None:
+    '''
+    Creates a structured numpy data type that maps all the fields of an
+    OpenCL structure with only scalar fields.
+
+    Parameters
+    ----------
+    cl_struct_type: cltypes.Structure
+        OpenCL structure type.
+
+    Returns
+    -------
+    dtype: np.dtype or None
+        Structured numpy data type with the same field offsets and
+        item size as the OpenCL structure or None if the structure
+        includes fields that are not scalars.
+    '''
+    names, formats = [], []
+    for name, field_type in cl_struct_type._fields_:
+        if not issubclass(field_type, ctypes._SimpleCData) or \
+                not hasattr(field_type, 'dtype'):
+            return None
+        names.append(name)
+        formats.append(np.dtype(field_type.dtype))
+    offsets = [getattr(cl_struct_type, name).offset for name in names]
+
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': ctypes.sizeof(cl_struct_type)})
+
+
+def _material_np_dtype(cl_material_type: cltypes.Structure) -> np.dtype:
+    '''
+    Creates a structured numpy data type that maps the scalar
+    floating-point fields of an OpenCL material structure. The scattering
+    phase function field is mapped as a nested structured data type
+    only if all the fields of the phase function structure are scalars.
+
+    Parameters
+    ----------
+    cl_material_type: cltypes.Structure
+        OpenCL structure type of a material as returned by
+        :py:meth:`Material.cl_type`.
+
+    Returns
+    -------
+    dtype: np.dtype
+        Structured numpy data type with the same field offsets and
+        item size as the OpenCL structure.
+    '''
+    names, formats = [], []
+    for name, field_type in cl_material_type._fields_:
+        if name == 'pf':
+            field_dtype = _struct_np_dtype(field_type)
+            if field_dtype is None:
+                continue
+        else:
+            field_dtype = np.dtype(field_type.dtype)
+        names.append(name)
+        formats.append(field_dtype)
+    offsets = [getattr(cl_material_type, name).offset for name in names]
+
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': ctypes.sizeof(cl_material_type)})
+
+
 class Material(mcobject.McObject):
     '''
     Class that represents a single material.
     '''
 
+    _cl_types_cache = {}
+    '''
+    OpenCL structure types and the related structured numpy data types
+    of materials keyed by (mc.types, type(pf)).
+    '''
+
+    _cl_source_cache = {}
+    '''
+    OpenCL declarations and implementations of materials keyed by
+    (kind, mc.types, type(pf)), where kind is "declaration" or
+    "implementation".
+    '''
+
+    def cl_types(self, mc: mcobject.McObject) \
+            -> Tuple[cltypes.Structure, np.dtype]:
+        '''
+        Returns a structure data type that is used to represent one material
+        instance in the OpenCL kernel of the Monte Carlo simulator and
+        a structured numpy data type that maps the scalar fields of the
+        structure. The types are created once for each combination of the
+        simulator data types and scattering phase function type.
+
+        Parameters
+        ----------
+        mc: mcobject.McObject
+            Monte Carlo simulator instance.
+
+        Returns
+        -------
+        opencl_t: ClMaterial
+            OpenCL Structure that represents a material.
+        np_dtype: np.dtype
+            Structured numpy data type that maps the scalar fields of
+            the OpenCL structure. The pf field is included only if the
+            phase function structure has only scalar fields.
+        '''
+        key = (mc.types, type(self.pf))
+        types = Material._cl_types_cache.get(key)
+        if types is None:
+            T = mc.types
+            class ClMaterial(cltypes.Structure):
+                _fields_ = [
+                    ('n', T.mc_fp_t),
+                    ('mus', T.mc_fp_t),
+                    ('mua', T.mc_fp_t),
+                    ('inv_mut', T.mc_fp_t),
+                    ('mua_inv_mut', T.mc_fp_t),
+                    ('pf', self.pf.fetch_cl_type(mc))
+                ]
+            types = (ClMaterial, _material_np_dtype(ClMaterial))
+            Material._cl_types_cache[key] = types
+
+        return types
+
     def cl_type(self, mc: mcobject.McObject) -> cltypes.Structure:
         '''
         Returns a structure data type that is used to represent one material
@@ -49,18 +218,7 @@ class Material(mcobject.McObject):
         opencl_t: ClMaterial
             OpenCL Structure that represents a material. 
         '''
-        T = mc.types
-        class ClMaterial(cltypes.Structure):
-            _fields_ = [
-                ('n', T.mc_fp_t),
-                ('mus', T.mc_fp_t),
-                ('mua', T.mc_fp_t),
-                ('inv_mut', T.mc_fp_t),
-                ('mua_inv_mut', T.mc_fp_t),
-                ('pf', self.pf.fetch_cl_type(mc))
-            ]
-
-        return ClMaterial
+        return self.cl_types(mc)[0]
 
     def cl_declaration(self, mc: mcobject.McObject) -> str:
         '''
@@ -68,6 +226,15 @@ class Material(mcobject.McObject):
         related API calls. This is a minimal implementation. All the field
         are required!
         '''
+        key = ('declaration', mc.types, type(self.pf))
+        declaration = Material._cl_source_cache.get(key)
+        if declaration is None:
+            declaration = self._make_cl_declaration(mc)
+            Material._cl_source_cache[key] = declaration
+
+        return declaration
+
+    def _make_cl_declaration(self, mc: mcobject.McObject) -> str:
         return '\n'.join((
             self.pf.fetch_cl_declaration(mc),
             '',
@@ -165,6 +332,15 @@ class Material(mcobject.McObject):
         '''
         OpenCL implementation of the Material type.
         '''
+        key = ('implementation', mc.types, type(self.pf))
+        implementation = Material._cl_source_cache.get(key)
+        if implementation is None:
+            implementation = self._make_cl_implementation(mc)
+            Material._cl_source_cache[key] = implementation
+
+        return implementation
+
+    def _make_cl_implementation(self, mc: mcobject.McObject) -> str:
         return '\n'.join((
             self.pf.fetch_cl_implementation(mc),
         ))
@@ -202,6 +378,7 @@ class Material(mcobject.McObject):
         self._mua = float(mua)
         self._mus = float(mus)
         self._pf = pf
+        self._inv_mut = self._mua_inv_mut = None
 
     def _set_n(self, n: float):
         self._n = float(n)
@@ -211,16 +388,40 @@ class Material(mcobject.McObject):
 
     def _set_mua(self, mua: float):
         self._mua = float(mua)
+        self._inv_mut = self._mua_inv_mut = None
     def _get_mua(self) -> float:
         return self._mua
     mua = property(_get_mua, _set_mua, None, 'Absorption coefficient (1/m).')
 
     def _set_mus(self, mus: float):
         self._mus = float(mus)
+        self._inv_mut = self._mua_inv_mut = None
     def _get_mus(self) -> float:
         return self._mus
     mus = property(_get_mus, _set_mus, None, 'Scattering coefficient (1/m).')
 
+    def _get_inv_mut(self) -> float:
+        if self._inv_mut is None:
+            mut = self._mua + self._mus
+            if mut > 0.0:
+                self._inv_mut = 1.0/mut
+            else:
+                self._inv_mut = float('inf')
+        return self._inv_mut
+    inv_mut = property(_get_inv_mut, None, None,
+                       'Reciprocal of the total attenuation coefficient (m).')
+
+    def _get_mua_inv_mut(self) -> float:
+        if self._mua_inv_mut is None:
+            if self._mus == 0.0:
+                self._mua_inv_mut = 1.0
+            else:
+                self._mua_inv_mut = self._mua*self._get_inv_mut()
+        return self._mua_inv_mut
+    mua_inv_mut = property(_get_mua_inv_mut, None, None,
+                           'Absorption coefficient multiplied by the '
+                           'reciprocal of the total attenuation coefficient.')
+
     def _get_pf(self) -> mcpf.PfBase:
         return self._pf
     def _set_pf(self, pf: mcpf.PfBase):
@@ -253,23 +454,11 @@ class Material(mcobject.McObject):
             target_type = self.fetch_cl_type(mc)
             target = target_type()
 
-        mut = self.mua + self.mus
-
-        if mut > 0.0:
-            inv_mut = 1.0/mut
-        else:
-            inv_mut = float('inf')
-
-        if self.mus == 0.0:
-            mua_inv_mut = 1.0
-        else:
-            mua_inv_mut = self.mua*inv_mut
-
         target.n = self.n
         target.mua = self.mua
         target.mus = self.mus
-        target.inv_mut = inv_mut
-        target.mua_inv_mut = mua_inv_mut
+        target.inv_mut = self.inv_mut
+        target.mua_inv_mut = self.mua_inv_mut
 
         self.pf.cl_pack(mc, target.pf)
 
@@ -703,6 +892,15 @@ class Materials(mcobject.McObject):
         if self._material_type is None:
             self._material_type = type(self._materials[0])
 
+        material_types = {type(material) for material in self._materials}
+        if material_types == {self._material_type} and \
+                issubclass(self._material_type,
+                           (Material, AnisotropicMaterial)):
+            pf_types = {type(material.pf) for material in self._materials}
+            if pf_types == {self._pf_type}:
+                return
+
+        # locate the first inconsistent material and report the error
         for material in self._materials:
             if not isinstance(material, (Material, AnisotropicMaterial)):
                 raise TypeError('All materials must be instances of Material '
@@ -793,8 +991,38 @@ class Materials(mcobject.McObject):
             target_type = self.fetch_cl_type(mc)
             target = target_type()
 
-        for material, target_item in zip(self._materials, target):
-            material.cl_pack(mc, target_item)
+        if self.material_type is not Material:
+            for material, target_item in zip(self._materials, target):
+                material.cl_pack(mc, target_item)
+            return target
+
+        cl_material_type, np_dtype = self._materials[0].cl_types(mc)
+        if target._type_ is not cl_material_type:
+            np_dtype = _material_np_dtype(target._type_)
+
+        if num_materials < _SMALL_STACK_SIZE:
+            packer = _material_struct(np_dtype)
+            if packer is not None:
+                stride = np_dtype.itemsize
+                for index, material in enumerate(self._materials):
+                    packer.pack_into(target, index*stride,
+                                     *_material_properties(material))
+                    material.pf.cl_pack(mc, target[index].pf)
+                return target
+
+        data = np.asarray(
+            list(map(_material_properties, self._materials)), dtype=float)
+        view = np.frombuffer(target, dtype=np_dtype)
+        for column, field in enumerate(_MATERIAL_FIELDS):
+            view[field] = data[:, column]
+
+        pf_type = type(self._materials[0].pf)
+        cl_pack_many = getattr(pf_type, 'cl_pack_many', None)
+        if cl_pack_many is not None and 'pf' in np_dtype.names:
+            cl_pack_many(mc, [m.pf for m in self._materials], view['pf'])
+        else:
+            for material, target_item in zip(self._materials, target):
+                material.pf.cl_pack(mc, target_item.pf)
 
         return target
 
@@ -20,13 +20,58 @@
 # along with PyXOpto. If not, see <https://www.gnu.org/licenses/>.
 ################################# End license ##################################
 
-from typing import Tuple
+from typing import List, Tuple
+import functools
+import math
+
 import numpy as np
 
 from .pfbase import PfBase, cltypes, McObject
 import xopto.pf
 
 
+@functools.lru_cache(maxsize=4096)
+def _gk_precalc(g: float, a: float) -> Tuple[float, float, float]:
+    '''
+    Computes the constants that are used by the OpenCL kernel to sample
+    the Gegenbauer kernel scattering phase function.
+
+    Parameters
+    ----------
+    g: float
+        Parameter g of the Gegenbauer kernel scattering phase function.
+    a: float
+        Parameter alpha of the Gegenbauer kernel scattering phase function.
+
+    Returns
+    -------
+    inv_a, a1, a2: float
+        Precalculated constants.
+    '''
+    if g == 0:
+        # cosTheta = 1 - 2*random
+        invA = a1 = a2 = 0
+    elif a == 0:
+        # cosTheta = (1+g^2)/(2*g) - ((1-g)/(1+g)).^(2*random)*(1+2*g+g^2)/(2*g)
+        g2 = g*g
+        a1 = (1.0 + g2)/(2.0*g)
+        a2 = (1.0 + 2.0*g + g2)/(2.0*g)
+        invA = 0.0
+    else:
+        # tmp = a1 * random + a2
+        # tmp = 1 + g * g - pow(tmp, -inva)
+        # cosTheta = tmp / (2*g)
+
+        two_a = 2.0*a
+        temp = a*g*(1.0 - g*g)**two_a
+        temp = temp/(math.pi*((1.0 + g)**two_a - (1.0 - g)**two_a))
+        a1 = 2.0*a*g/(2.0*math.pi*temp)
+        a2 = (1.0 + g)**(-two_a)
+        invA = 1.0/a
+
+    return invA, a1, a2
+
+
 class Gk(PfBase):
     @staticmethod
     def cl_type(mc: McObject) -> cltypes.Structure:
@@ -143,11 +188,10 @@ class Gk(PfBase):
             phase function.
         '''
         super().__init__()
-        self._g = self._a = 0.0
-        self._precalculated = None
+        self._g = min(max(float(g), -1.0), 1.0)
+        self._a = max(float(a), -0.5)
+        self._inv_a = self._a1 = self._a2 = 0.0
 
-        self._set_g(g)
-        self._set_a(a)
         self._recalculate()
 
     def _get_g(self) -> float:
@@ -166,27 +210,12 @@ class Gk(PfBase):
 
     def _recalculate(self) -> Tuple[float, float, float]:
         # precalculate some values
-        g, a = self._g, self._a
-        if g == 0:
-            # cosTheta = 1 - 2*random
-            invA = a1 = a2 = 0
-        elif a == 0:
-            # cosTheta = (1+g^2)/(2*g) - ((1-g)/(1+g)).^(2*random)*(1+2*g+g^2)/(2*g)
-            a1 = (1 + g**2)/(2*g)
-            a2 = (1 + 2*g + g**2)/(2*g)
-            invA = 0.0
-        else:
-            # tmp = a1 * random + a2
-            # tmp = 1 + g * g - pow(tmp, -inva)
-            # cosTheta = tmp / (2*g)
-
-            temp = a*g*(1.0 - g*g)**(2.0*a)
-            temp = temp/(np.pi*((1.0 + g)**(2.0*a) - (1.0 - g)**(2.0*a)))
-            a1 = 2.0*a*g/(2.0*np.pi*temp)
-            a2 = (1 + g)**(-2.0*a)
-            invA = 1.0/a
-
-        self._precalculated = [invA, a1, a2]
+        self._inv_a, self._a1, self._a2 = _gk_precalc(self._g, self._a)
+
+    def _get_precalculated(self) -> Tuple[float, float, float]:
+        return self._inv_a, self._a1, self._a2
+    _precalculated = property(_get_precalculated, None, None,
+                              'Precalculated constants (inv_a, a1, a2).')
 
     def pf(self) -> xopto.pf.Gk:
         '''
@@ -227,12 +256,39 @@ class Gk(PfBase):
 
         target.g = self._g
         target.a = self._a
-        target.inv_a = self._precalculated[0]
-        target.a1 = self._precalculated[1]
-        target.a2 = self._precalculated[2]
+        target.inv_a = self._inv_a
+        target.a1 = self._a1
+        target.a2 = self._a2
 
         return target
 
+    @classmethod
+    def cl_pack_many(cls, mc: McObject, pfs: List['Gk'], target: np.ndarray):
+        '''
+        Fills a structured numpy array that maps the OpenCL structures
+        of several scattering phase functions. See the
+        :py:meth:`~Gk.cl_type` method for a detailed list of fields.
+
+        Parameters
+        ----------
+        mc: McObject
+            Simulator instance.
+        pfs: List[Gk]
+            Scattering phase functions to pack.
+        target: np.ndarray
+            Structured numpy array (view) with fields g, a, inv_a, a1 and
+            a2 that has the same length as pfs.
+        '''
+        data = np.array(
+            [(pf._g, pf._a, pf._inv_a, pf._a1, pf._a2) for pf in pfs],
+            dtype=float).reshape(-1, 5)
+
+        target['g'] = data[:, 0]
+        target['a'] = data[:, 1]
+        target['inv_a'] = data[:, 2]
+        target['a1'] = data[:, 3]
+        target['a2'] = data[:, 4]
+
     def todict(self) -> dict:
         '''
         Export object to a dict.
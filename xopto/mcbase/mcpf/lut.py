@@ -269,7 +269,7 @@ class Lut(PfBase):
 
 class LutEx(Lut):
     def __init__(self, pftype: PfBase or str, pfargs: list,
-                 lutsize: int = 2000, **kwargs):
+                 lutsize: int = 2000, pf_obj: PfBase = None, **kwargs):
         '''
         Creates a Monte Carlo lookup table-based scattering phase function
         instance from a standard scattering phase function instance
@@ -284,6 +284,9 @@ class LutEx(Lut):
             A list of scattering phase function parameters passed to the pftype.
         lutsize: int
             Number of elements in the lookup table.
+        pf_obj: PfBase
+            An existing instance created as :code:`pftype(*pfargs)`. If
+            provided, the scattering phase function is not created again.
         kwargs: dict
             Additional keyword arguments passed to the lut method of the
             scattering phase function as
@@ -299,7 +302,9 @@ class LutEx(Lut):
 
         self._pfargs = pfargs
         self._kwargs = kwargs
-        self._pf_obj = pftype(*pfargs)
+        if pf_obj is None:
+            pf_obj = pftype(*pfargs)
+        self._pf_obj = pf_obj
         lut_args = self._pf_obj.mclut(lutsize, **kwargs)
         super().__init__(*lut_args)
 
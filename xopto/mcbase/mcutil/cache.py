@@ -48,7 +48,8 @@ class ObjCache:
         '''
         return ObjCache(cachefile=cachefile, **kwargs)
 
-    def __init__(self, cachefile: str = None, verbose: bool = False):
+    def __init__(self, cachefile: str = None, verbose: bool = False,
+                 maxsize: int = None):
         '''
         ObjCache constructor.
 
@@ -58,9 +59,21 @@ class ObjCache:
             File location or a binary file like object.
         verbose: bool
             Print information to stdout.
+        maxsize: int
+            Maximum number of objects kept in the cache. If the cache is
+            full, the least recently used object is removed from the cache.
+            If None, the size of the cache is not limited. Objects loaded
+            from the cache file are never removed - the maximum size is
+            raised to the number of loaded objects if required.
         '''
+        if maxsize is not None:
+            maxsize = int(maxsize)
+            if maxsize < 1:
+                raise ValueError('The maximum cache size must be at least 1!')
+
         self._cache = {}
         self._verbose = bool(verbose)
+        self._maxsize = maxsize
 
         if cachefile is not None:
             if isinstance(cachefile, str):
@@ -72,6 +85,8 @@ class ObjCache:
             if not isinstance(cache, dict):
                 raise ValueError('The loaded object cache file is not valid!')
             self._cache = cache
+            if self._maxsize is not None:
+                self._maxsize = max(self._maxsize, len(cache))
 
     def save(self, cachefile: str):
         '''
@@ -95,6 +110,40 @@ class ObjCache:
         '''
         return self._verbose
 
+    def maxsize(self) -> int or None:
+        '''
+        Returns the maximum number of objects kept in the cache or None if
+        the size of the cache is not limited.
+        '''
+        return self._maxsize
+
+    def clear(self):
+        '''
+        Removes all the objects from the cache.
+        '''
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _lookup(self, obj_key: tuple) -> object:
+        # Returns the cached object or None. The dict keeps the insertion
+        # order, hence the most recently used objects are moved to the end.
+        obj = self._cache.get(obj_key)
+        if obj is not None and self._maxsize is not None:
+            self._cache[obj_key] = self._cache.pop(obj_key)
+        return obj
+
+    def _store(self, obj_key: tuple, obj: object):
+        self._cache[obj_key] = obj
+        self._evict()
+
+    def _evict(self):
+        # removes the least recently used objects from a full cache
+        if self._maxsize is not None:
+            while len(self._cache) > self._maxsize:
+                del self._cache[next(iter(self._cache))]
+
     def get(self, obj_type: type, *args) -> object:
         '''
         Request an object of type obj_type and constructor arguments args
@@ -115,10 +164,10 @@ class ObjCache:
         '''
         obj_key = (obj_type, *args)
 
-        obj = self._cache.get(obj_key)
+        obj = self._lookup(obj_key)
         if obj is None:
             obj = obj_type(*args)
-            self._cache[obj_key] = obj
+            self._store(obj_key, obj)
 
         return obj
 
@@ -163,8 +212,7 @@ class ObjCache:
         '''
         obj_key = (obj_type, *args)
         if obj_key not in self._cache:
-            obj = obj_type(*args)
-            self._cache[obj_key] = obj
+            self._store(obj_key, value)
             return True
 
         return False
@@ -191,7 +239,7 @@ class LutCache(ObjCache):
         return LutCache(cachefile=cachefile, **kwargs)
 
     def __init__(self, lutsize: int = 2000, verbose: bool = False,
-                 cachefile: str = None):
+                 cachefile: str = None, maxsize: int = None):
         '''
         Initializes a lookup table-based Monte Carlo scattering phase function
         cache (:py:class:`~xopto.mcbase.mcpf.LutPhaseFunction` objects).
@@ -209,8 +257,13 @@ class LutCache(ObjCache):
         cachefile: str or file
             File location or a binary file like object from which to
             load LutCache.
+        maxsize: int
+            Maximum number of lookup tables kept in the cache. If the cache
+            is full, the least recently used lookup table is removed from
+            the cache. If None, the size of the cache is not limited.
         '''
-        ObjCache.__init__(self, verbose=verbose, cachefile=cachefile)
+        ObjCache.__init__(self, verbose=verbose, cachefile=cachefile,
+                          maxsize=maxsize)
         self._lutsize = int(lutsize)
 
         if cachefile is not None:
@@ -241,8 +294,38 @@ class LutCache(ObjCache):
             ObjCache.save(self, cachefile)
             pickle.dump(lut_options, cachefile, protocol=PICKLE_PROTOCOL)
 
-    def get(self, pftype: Type[PfBase], pfargs: tuple, lutsize: int = None) \
-            -> object:
+    def contains(self, pftype: Type[PfBase], pfargs: tuple,
+                 lutsize: int = None) -> bool:
+        '''
+        Checks if the specified lookup table-based scattering phase function
+        is in the cache.
+
+        Parameters
+        ----------
+        pftype: Type[xopto.pf.PfBase]
+            Any type of a scattering phase function that inherits from
+            the :py:class:`xopto.pf.PfBase` class.
+        pfargs: tuple
+            Parameters passed to the scattering phase function constructor.
+        lutsize: int
+            Size of the lookup table. If None, the value passed to the
+            constructor is used.
+
+        Returns
+        -------
+        found: bool
+            Returns True if the specified lookup table-based scattering
+            phase function is found in the cache.
+        '''
+        if lutsize is not None:
+            lutsize = int(lutsize)
+        else:
+            lutsize = self._lutsize
+
+        return ObjCache.contains(self, LutEx, pftype, tuple(pfargs), lutsize)
+
+    def get(self, pftype: Type[PfBase], pfargs: tuple, lutsize: int = None,
+            pf_obj: PfBase = None) -> object:
         '''
         Prepare a new lookup table-based scattering phase function. Computations
         are made only if the requested scattering phase function is not found
@@ -260,6 +343,10 @@ class LutCache(ObjCache):
             Size of the lookup table passed to the
             py:meth:`xopto.mcbase.pf.lut.LutEx`.
             If None, the value passed to the constructor is used.
+        pf_obj: xopto.pf.PfBase
+            An existing scattering phase function instance created as
+            :code:`pftype(*pfargs)` that is used to compute the lookup
+            table if one is not found in the cache.
 
         Returns
         -------
@@ -290,7 +377,14 @@ class LutCache(ObjCache):
                         pftype.__name__, str(pfargs), lutsize)
                 )
 
-        obj = ObjCache.get(self, LutEx, pftype, pfargs, lutsize)
+        if pf_obj is None:
+            obj = ObjCache.get(self, LutEx, pftype, pfargs, lutsize)
+        else:
+            obj_key = (LutEx, pftype, pfargs, lutsize)
+            obj = self._lookup(obj_key)
+            if obj is None:
+                obj = LutEx(pftype, pfargs, lutsize, pf_obj=pf_obj)
+                self._store(obj_key, obj)
 
         return obj
 
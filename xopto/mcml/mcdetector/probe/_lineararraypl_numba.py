@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+################################ Begin license #################################
+# Copyright (C) Laboratory of Imaging technologies,
+#               Faculty of Electrical Engineering,
+#               University of Ljubljana.
+#
+# This file is part of PyXOpto.
+#
+# PyXOpto is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# PyXOpto is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PyXOpto. If not, see <https://www.gnu.org/licenses/>.
+################################# End license ##################################
+
+
+import numpy as np
+import numba as nb
+
+
+@nb.jit(nopython=True, parallel=True, cache=True)
+def normalize_and_bin(raw: np.ndarray, edges: np.ndarray,
+                      nphotons: int) -> np.ndarray:
+    '''
+    Normalizes the raw path length accumulators of a linear fiber array
+    by the number of photon packets and the width of the path length bins
+    in a single pass over the data.
+
+    Parameters
+    ----------
+    raw: np.ndarray
+        Raw accumulator data of shape (n_pl, n).
+    edges: np.ndarray
+        Edges of the n_pl path length bins (n_pl + 1 values).
+    nphotons: int
+        The number of photon packets that produced the raw data.
+
+    Returns
+    -------
+    density: np.ndarray
+        Path length density of the detected weight for each fiber
+        as an array of shape (n_pl, n).
+    '''
+    n_pl, n = raw.shape
+    out = np.empty((n_pl, n))
+    k = 1.0/max(nphotons, 1.0)
+    for i in nb.prange(n_pl):
+        width = edges[i + 1] - edges[i]
+        scale = k/width if width > 0.0 else 0.0
+        for j in range(n):
+            out[i, j] = raw[i, j]*scale
+    return out
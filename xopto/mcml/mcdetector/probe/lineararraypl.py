@@ -20,7 +20,9 @@
 # along with PyXOpto. If not, see <https://www.gnu.org/licenses/>.
 ################################# End license ##################################
 
-from typing import Tuple
+from typing import List, Tuple
+import ctypes
+import math
 
 import numpy as np
 
@@ -29,8 +31,27 @@ from xopto.mcml import cltypes, mctypes, mcobject, mcoptions
 from xopto.mcml.mcutil.fiber import MultimodeFiber
 from xopto.mcml.mcutil import geometry
 from xopto.mcml.mcutil import axis
+from xopto.mcml.mcdetector.probe._lineararraypl_numba import normalize_and_bin
 
 class LinearArrayPl(Detector):
+    # The base classes do not define __slots__, so instances keep a __dict__
+    # for the attributes of the base classes.
+    __slots__ = (
+        '_n', '_fiber', '_spacing', '_orientation', '_direction', '_position',
+        '_positions', '_positions_key', '_pl_axis',
+        '_cached_T', '_cached_T_cl', '_cached_T_key',
+        '_cached_delta', '_cached_delta_key',
+        '_cached_fiber_key', '_cached_core_r2', '_cached_cos_min',
+        '_normalized', '_normalized_key', '_cl_target',
+    )
+
+    _cl_source_cache = {}
+    '''
+    OpenCL declarations keyed by ("declaration", location) and
+    implementations keyed by ("implementation", location, n, logscale,
+    mad24), where mad24 is True if the accumulator index fits into 24 bits.
+    '''
+
     @staticmethod
     def cl_type(mc: mcobject.McObject) -> cltypes.Structure:
         T = mc.types
@@ -45,8 +66,11 @@ class LinearArrayPl(Detector):
                 Transforms coordinates from Monte Carlo to the detector.
             first_position: mc_point2f_t
                 The center of the first optical fiber in the array.
-            delta_position: mc_point2f_t
-                Distance vector between two neighboring optical fibers.
+            delta_detector: mc_point2f_t
+                Distance vector between two neighboring optical fibers
+                in the detector coordinate space.
+            inv_delta_detector_squared: mc_fp_t
+                Inverse of the squared length of the delta_detector vector.
             core_r_squared: mc_fp_t
                 Squared radius of the optical fibers.
             cos_min: mc_fp_t
@@ -63,11 +87,15 @@ class LinearArrayPl(Detector):
                 detector buffer.
             pl_log_scale: mc_int_t
                 A flag indicating logarithmic scale of the path length axis.
+            use_transformation: mc_int_t
+                A flag indicating that the transformation is not an identity,
+                i.e. the detector direction is not along the z axis.
             '''
             _fields_ = [
                 ('transformation', T.mc_matrix3f_t),
                 ('first_position', T.mc_point2f_t),
-                ('delta_position', T.mc_point2f_t),
+                ('delta_detector', T.mc_point2f_t),
+                ('inv_delta_detector_squared', T.mc_fp_t),
                 ('core_r_squared', T.mc_fp_t),
                 ('cos_min', T.mc_fp_t),
                 ('pl_min', T.mc_fp_t),
@@ -75,6 +103,7 @@ class LinearArrayPl(Detector):
                 ('n_pl', T.mc_size_t),
                 ('offset', T.mc_size_t),
                 ('pl_log_scale', T.mc_int_t),
+                ('use_transformation', T.mc_int_t),
             ]
         return ClLinearArrayPl
 
@@ -82,13 +111,23 @@ class LinearArrayPl(Detector):
         '''
         Structure that defines the detector in the Monte Carlo simulator.
         '''
+        key = ('declaration', self.location)
+        declaration = LinearArrayPl._cl_source_cache.get(key)
+        if declaration is None:
+            declaration = self._make_cl_declaration(mc)
+            LinearArrayPl._cl_source_cache[key] = declaration
+
+        return declaration
+
+    def _make_cl_declaration(self, mc: mcobject.McObject) -> str:
         loc = self.location
         Loc = loc.capitalize()
         return '\n'.join((
             'struct MC_STRUCT_ATTRIBUTES Mc{}Detector{{'.format(Loc),
             '	mc_matrix3f_t transformation;'
             '	mc_point2f_t first_position;'
-            '	mc_point2f_t delta_position;'
+            '	mc_point2f_t delta_detector;'
+            '	mc_fp_t inv_delta_detector_squared;'
             '	mc_fp_t core_r_squared;',
             '	mc_fp_t cos_min;',
             '	mc_fp_t pl_min;',
@@ -96,6 +135,7 @@ class LinearArrayPl(Detector):
             '	mc_size_t n_pl;',
             '	mc_size_t offset;',
             '	mc_int_t pl_log_scale;',
+            '	mc_int_t use_transformation;',
             '};'
         ))
 
@@ -103,15 +143,58 @@ class LinearArrayPl(Detector):
         '''
         Implementation of the detector accumulator in the Monte Carlo simulator.
         '''
+        key = ('implementation', self.location, self._n,
+               bool(self._pl_axis.logscale), self._pl_axis.n*self._n < 2**24)
+        implementation = LinearArrayPl._cl_source_cache.get(key)
+        if implementation is None:
+            implementation = self._make_cl_implementation(mc)
+            LinearArrayPl._cl_source_cache[key] = implementation
+
+        return implementation
+
+    def _make_cl_implementation(self, mc: mcobject.McObject) -> str:
         loc = self.location
         Loc = loc.capitalize()
         n = self._n
+        if n == 1:
+            # single fiber - the hit position is already relative to the fiber
+            index_code = (
+                '	mc_size_t fiber_index = 0;',
+                '',
+                '	dx = detector_pos.x;',
+                '	dy = detector_pos.y;',
+            )
+        else:
+            index_code = (
+                '	/* The fibers lie on a line - index of the closest fiber center. */',
+                '	mc_fp_t t = (detector_pos.x*detector->delta_detector.x + ',
+                '		detector_pos.y*detector->delta_detector.y)*',
+                '		detector->inv_delta_detector_squared;',
+                '	mc_size_t fiber_index = mc_clip(mc_int(round(t)), 0, {});'.format(n - 1),
+                '',
+                '	/* Offset from the fiber center - no per-fiber data are loaded. */',
+                '	dx = detector_pos.x - fiber_index*detector->delta_detector.x;',
+                '	dy = detector_pos.y - fiber_index*detector->delta_detector.y;',
+            )
+        if self._pl_axis.logscale:
+            # the path length axis cannot be changed once the detector is
+            # created - include the logarithm only for log-scale axes
+            pl_code = ('	pl = mc_log(mc_fmax(pl, FP_PLMIN));',)
+        else:
+            pl_code = ()
+        if self._pl_axis.n*n < 2**24:
+            # all the operands fit into 24 bits
+            index_line = '	mc_size_t index = mad24((uint)pl_index, (uint){}, ' \
+                '(uint)fiber_index);'.format(n)
+        else:
+            index_line = '	mc_size_t index = pl_index*{} + fiber_index;'.format(n)
         return '\n'.join((
             'void dbg_print_{}_detector(__mc_detector_mem const Mc{}Detector *detector){{'.format(loc, Loc),
             '	dbg_print("Mc{}Detector - LinearArrayPl fiber array detector:");'.format(Loc),
             '	dbg_print_matrix3f(INDENT "transformation:", &detector->transformation);',
             '	dbg_print_point2f(INDENT "first_position:", &detector->first_position);',
-            '	dbg_print_point2f(INDENT "delta_position:", &detector->delta_position);',
+            '	dbg_print_point2f(INDENT "delta_detector:", &detector->delta_detector);',
+            '	dbg_print_float(INDENT "inv_delta_detector_squared (1/mm2):", detector->inv_delta_detector_squared*1e-6f);',
             '	dbg_print_float(INDENT "core_r_squared (mm2):", detector->core_r_squared*1e6f);',
             '	dbg_print_float(INDENT "cos_min:", detector->cos_min);',
             '	dbg_print_float(INDENT "pl_min (um)", detector->pl_min*1e6f);',
@@ -119,6 +202,7 @@ class LinearArrayPl(Detector):
             '	dbg_print_size_t(INDENT "n_pl:", detector->n_pl);',
             '	dbg_print_size_t(INDENT "offset:", detector->offset);',
             '	dbg_print_int(INDENT "pl_log_scale:", detector->pl_log_scale);',
+            '	dbg_print_int(INDENT "use_transformation:", detector->use_transformation);',
             '};',
             '',
             'inline void mcsim_{}_detector_deposit('.format(loc),
@@ -133,55 +217,48 @@ class LinearArrayPl(Detector):
             '	__mc_detector_mem const Mc{}Detector *detector = '.format(Loc),
             '		mcsim_{}_detector(mcsim);'.format(loc),
             '',
-            '	mc_size_t fiber_index = {}; /* invalid index ... no fiber hit */'.format(n),
-            '',
             '	mc_fp_t dx, dy, r_squared;',
             '	mc_point3f_t mc_pos, detector_pos;',
-            '	mc_fp_t fiber_x = detector->first_position.x;',
-            '	mc_fp_t fiber_y = detector->first_position.y;',
             '',
-            '	pragma_unroll_hint({})'.format(n),
-            '	for(mc_size_t index=0; index < {}; ++index){{'.format(n),
-            '		mc_pos.x = pos->x - fiber_x;',
-            '		mc_pos.y = pos->y - fiber_y;',
-            '		mc_pos.z = FP_0;',
-            '',
-            '		mc_matrix3f_t transformation = detector->transformation;',
+            '	/* Transform the position relative to the first fiber only once. */',
+            '	mc_pos.x = pos->x - detector->first_position.x;',
+            '	mc_pos.y = pos->y - detector->first_position.y;',
+            '	mc_pos.z = FP_0;',
+            '	/* Load the transformation once and reuse it for the direction. */',
+            '	/* The flag is uniform across all the threads - no divergence. */',
+            '	mc_matrix3f_t transformation;',
+            '	if (detector->use_transformation){',
+            '		transformation = detector->transformation;',
             '		transform_point3f(&transformation, &mc_pos, &detector_pos);',
-            '		dx = detector_pos.x;',
-            '		dy = detector_pos.y;',
-            '		r_squared = dx*dx + dy*dy;',
-            '',
-            '		if (r_squared <= detector->core_r_squared){',
-            '			/* hit this fiber */',
-            '			fiber_index = index;',
-            '			break;',
-            '		};',
-            '',
-            '		fiber_x += detector->delta_position.x;',
-            '		fiber_y += detector->delta_position.y;',
+            '	} else {',
+            '		detector_pos = mc_pos;',
             '	};',
             '',
-            '	if (fiber_index >= {})'.format(n),
+            *index_code,
+            '	r_squared = dx*dx + dy*dy;',
+            '',
+            '	if (r_squared > detector->core_r_squared)',
             '		return;',
             '',
             '	mc_fp_t pl = mcsim_optical_pathlength(mcsim);',
-            '	if (detector->pl_log_scale)',
-            '	    pl = mc_log(mc_fmax(pl, FP_PLMIN));',
+            *pl_code,
             '	mc_int_t pl_index = mc_int((pl - detector->pl_min)*detector->inv_dpl);',
-            '	pl_index = mc_clip(pl_index, 0, detector->n_pl - 1);',
+            '	pl_index = mc_max(0, mc_min(pl_index, (mc_int_t)detector->n_pl - 1));',
             '',
-            '	mc_size_t index = pl_index*{} + fiber_index;'.format(n),
+            index_line,
             '',
             '	address = mcsim_accumulator_buffer_ex(',
             '		mcsim, detector->offset + index);',
             '',
             '	/* Transfor direction vector component z into the detector space. */',
-            '	mc_fp_t pz = transform_point3f_z(&detector->transformation, dir);',
+            '	mc_fp_t pz = (detector->use_transformation) ?',
+            '		transform_point3f_z(&transformation, dir) : dir->z;',
             '	dbg_print_float("Packet direction z:", pz);',
-            '	uint32_t ui32w = weight_to_int(weight)*',
-            '		(detector->cos_min <= mc_fabs(pz));',
+            '	/* All bits set if within the acceptance cone, else 0. */',
+            '	uint32_t mask = (uint32_t)(-(mc_int_t)(detector->cos_min <= mc_fabs(pz)));',
+            '	uint32_t ui32w = ((uint32_t)weight_to_int(weight)) & mask;',
             '',
+            '	/* Keep the gate - an atomic add of 0 still costs a global memory transaction. */',
             '	if (ui32w > 0){',
             '		dbg_print("{} LinearArrayPl fiber array detector depositing:");'.format(Loc),
             '		dbg_print_uint(INDENT "uint weight:", ui32w);',
@@ -202,7 +279,8 @@ class LinearArrayPl(Detector):
                  plaxis: axis.Axis = None,
                  orientation: Tuple[float, float] = (1.0, 0.0),
                  position: Tuple[float, float] = (0.0, 0.0),
-                 direction: Tuple[float, float, float] = (0.0, 0.0, 1.0)):
+                 direction: Tuple[float, float, float] = (0.0, 0.0, 1.0),
+                 share_data: bool = False):
         '''
         Optical fiber probe detector with a linear array of optical fibers that
         are optionally tilted(direction parameter). The optical fibers are
@@ -238,6 +316,12 @@ class LinearArrayPl(Detector):
             contact with the sample (the fiber cross sections are ellipsoids
             if the direction is not perpendicular, i.e different
             from (0, 0, 1).
+        share_data: bool
+            Only used if the fiber argument is a LinearArrayPl instance.
+            If True, the new detector references the raw data buffer of the
+            source detector as a read-only array instead of making a copy.
+            The raw data of the new detector cannot be updated, while any
+            updates of the source detector are visible in the new detector.
         '''
         if isinstance(fiber, LinearArrayPl):
             la = fiber
@@ -248,14 +332,23 @@ class LinearArrayPl(Detector):
             position = la.position
             direction = la.direction
             nphotons = la.nphotons
-            raw_data = np.copy(la.raw)
+            if share_data:
+                raw_data = la.raw.view()
+                raw_data.flags.writeable = False
+            else:
+                raw_data = la.raw.copy(order='C')
             plaxis = la.plaxis
         else:
             if plaxis is None:
                 plaxis = axis.Axis(0.0, 1.0, 1)
             nphotons = 0
             n = max(int(n), 1)
-            raw_data = np.zeros((plaxis.n, n))
+            # The device accumulators (mc_accu_t) hold integer weights scaled
+            # by mc_accu_k and are converted to floating-point weights that
+            # are summed over the runs, which requires a float64 buffer.
+            # The path length axis comes first as in the other path length
+            # detectors (FiberArrayPl, SixAroundOnePl, RadialPl).
+            raw_data = np.zeros((plaxis.n, n), dtype=np.float64)
             if spacing is None:
                 spacing = fiber.dcladding
 
@@ -267,6 +360,18 @@ class LinearArrayPl(Detector):
         self._orientation = np.array((1.0, 0.0))
         self._direction = np.array((0.0, 0.0, 1.0))
         self._position = np.array((0.0, 0.0))
+        self._positions = None
+        self._positions_key = None
+        self._cached_T = None
+        self._cached_T_cl = None
+        self._cached_T_key = None
+        self._cached_delta = None
+        self._cached_delta_key = None
+        self._cached_fiber_key = None
+        self._cl_target = None
+        self._cached_core_r2 = self._cached_cos_min = 0.0
+        self._normalized = None
+        self._normalized_key = None
         self._pl_axis = plaxis
 
         self._set_fiber(fiber)
@@ -294,16 +399,17 @@ class LinearArrayPl(Detector):
             self.position = other.position
             self.direction = other.direction
         elif isinstance(other, dict):
-            self.fiber = other.get('fiber', self.fiber)
-            self.spacing = other.get('spacing', self.spacing)
-            self.orientation = other.get('orientation', self.orientation)
-            self.position = other.get('position', self.position)
-            self.direction = other.get('direction', self.direction)
+            # only the present keys - avoids resetting the cached values
+            for key in ('fiber', 'spacing', 'orientation', 'position',
+                        'direction'):
+                if key in other:
+                    setattr(self, key, other[key])
 
     def _get_fiber(self) -> Tuple[float, float]:
         return self._fiber
     def _set_fiber(self, value: float or Tuple[float, float]):
         self._fiber = value
+        self._cached_fiber_key = None
     fiber = property(_get_fiber, _set_fiber, None,
                      'Properties of the optical fibers used by the detector.')
 
@@ -322,29 +428,56 @@ class LinearArrayPl(Detector):
     def _get_orientation(self) -> Tuple[float, float]:
         return self._orientation
     def _set_orientation(self, orientation: Tuple[float, float]):
-        self._orientation[:] = orientation
-        norm = np.linalg.norm(self._orientation)
+        x, y = orientation
+        norm = math.hypot(x, y)
         if norm == 0.0:
             raise ValueError('Orientation vector norm/length must not be 0!')
-        self._orientation *= 1.0/norm
+        k = 1.0/norm
+        self._orientation[0] = x*k
+        self._orientation[1] = y*k
     orientation = property(_get_orientation, _set_orientation, None,
                          'Orientation / direction of the linear fiber array.')
 
     def _get_position(self) -> Tuple[float, float]:
         return self._position
     def _set_position(self, value: float or Tuple[float, float]):
-        self._position[:] = value
+        if isinstance(value, (int, float)):
+            x = y = value
+        else:
+            x, y = value
+        self._position[0] = x
+        self._position[1] = y
     position = property(_get_position, _set_position, None,
                        'Position of the fiber array center as a tuple (x, y).')
 
+    def _get_positions(self) -> np.ndarray:
+        # The position and orientation arrays can be modified in place -
+        # key the cache on the values.
+        key = (self._n, self._spacing, *self._position, *self._orientation)
+        if self._positions_key != key:
+            left = self._position - \
+                self._orientation*self._spacing*(self._n - 1)*0.5
+            positions = left + \
+                np.arange(self._n)[:, None]*self._spacing*self._orientation
+            positions.flags.writeable = False
+            self._positions = positions
+            self._positions_key = key
+        return self._positions
+    positions = property(_get_positions, None, None,
+                         'Positions of the fiber centers as a numpy array '
+                         'of shape (n, 2).')
+
     def _get_direction(self) -> Tuple[float, float, float]:
         return self._direction
     def _set_direction(self, direction: Tuple[float, float, float]):
-        self._direction[:] = direction
-        norm = np.linalg.norm(self._direction)
+        x, y, z = direction
+        norm = math.sqrt(x*x + y*y + z*z)
         if norm == 0.0:
             raise ValueError('Direction vector norm/length must not be 0!')
-        self._direction *= 1.0/norm
+        k = 1.0/norm
+        self._direction[0] = x*k
+        self._direction[1] = y*k
+        self._direction[2] = z*k
     direction = property(_get_direction, _set_direction, None,
                          'Detector reference direction.')
 
@@ -392,15 +525,56 @@ class LinearArrayPl(Detector):
         '''
         if index >= self._n or index < -self._n:
             raise IndexError('The fiber index is out of valid range!')
-        left = self._position - self._orientation*self._spacing*(self._n - 1)*0.5 
-        return tuple(left + self._spacing*self._orientation*int(index))
+        return tuple(self._get_positions()[int(index)])
+
+    def set_raw_data(self, data: np.ndarray, nphotons: int):
+        if not self.raw.flags.writeable:
+            raise RuntimeError('Shared raw data cannot be modified!')
+        super().set_raw_data(data, nphotons)
+        self._normalized = None
+
+    def update_data(self, mc: mcobject.McObject,
+                    accumulators: List[np.ndarray], nphotons: int, **kwargs):
+        if not self.raw.flags.writeable:
+            raise RuntimeError('Shared raw data cannot be modified!')
+        super().update_data(mc, accumulators, nphotons, **kwargs)
+        self._normalized = None
 
     def _get_normalized(self) -> np.ndarray:
-        return self.raw*(1.0/max(self.nphotons, 1.0))
-    normalized = property(_get_normalized, None, None, 'Normalized.')
+        raw = self.raw
+        if not raw.flags.writeable:
+            # shared raw data can be updated by the source detector
+            normalized = raw*(1.0/max(self.nphotons, 1.0))
+            normalized.flags.writeable = False
+            return normalized
+        key = (raw.__array_interface__['data'][0], raw.shape, self.nphotons)
+        if self._normalized is None or self._normalized_key != key:
+            self._normalized = raw*(1.0/max(self.nphotons, 1.0))
+            self._normalized.flags.writeable = False
+            self._normalized_key = key
+        return self._normalized
+    normalized = property(_get_normalized, None, None,
+                          'Normalized (read-only and cached until the raw '
+                          'data are updated).')
     reflectance = property(_get_normalized, None, None, 'Reflectance.')
     transmittance = property(_get_normalized, None, None, 'Transmittance.')
 
+    def normalized_binned(self) -> np.ndarray:
+        '''
+        Returns the normalized accumulator data divided by the width of
+        the path length bins, i.e. the path length density of the detected
+        weight for each fiber.
+
+        Returns
+        -------
+        density: np.ndarray
+            Path length density as an array of shape (npl, n).
+        '''
+        return normalize_and_bin(
+            np.ascontiguousarray(self.raw, dtype=np.float64),
+            np.ascontiguousarray(self._pl_axis.edges, dtype=np.float64),
+            self.nphotons)
+
     def cl_pack(self, mc: mcobject.McObject,
                 target: cltypes.Structure = None) -> cltypes.Structure:
         '''
@@ -419,26 +593,67 @@ class LinearArrayPl(Detector):
         Returns
         -------
         target: cltypes.Structure
-            Filled structure received as an input argument or a new
-            instance if the input argument target is None.
+            Filled structure received as an input argument or an instance
+            owned by this detector (reused by subsequent calls) if the input
+            argument target is None.
         '''
         if target is None:
-            target_type = self.cl_type(mc)
-            target = target_type()
+            if self._cl_target is None or self._cl_target[0] is not mc.types:
+                target_type = self.cl_type(mc)
+                self._cl_target = (mc.types, target_type())
+            target = self._cl_target[1]
 
         allocation = mc.cl_allocate_rw_accumulator_buffer(self, self.shape)
         target.offset = allocation.offset
 
-        adir = self._direction[0], self._direction[1], abs(self._direction[2])
-        T = geometry.transform_base(adir, (0.0, 0.0, 1.0))
-        target.transformation.fromarray(T)
-
-        target.core_r_squared = 0.25*self.fiber.dcore**2
-
-        target.cos_min = (1.0 - (self._fiber.na/self._fiber.ncore)**2)**0.5
-
-        target.first_position.fromarray(self.fiber_position(0))
-        target.delta_position.fromarray(self._orientation*self._spacing)
+        # the direction and orientation arrays can be modified in place -
+        # key the cached values on the vector components
+        direction_key = tuple(self._direction)
+        if self._cached_T_key != direction_key:
+            adir = self._direction[0], self._direction[1], \
+                abs(self._direction[2])
+            self._cached_T = geometry.transform_base(adir, (0.0, 0.0, 1.0))
+            self._cached_T_cl = None
+            self._cached_T_key = direction_key
+        T = self._cached_T
+        target.use_transformation = abs(self._direction[2]) <= 1.0 - 1e-12
+        T_cl = self._cached_T_cl
+        if T_cl is None or T_cl.dtype != mc.types.np_float:
+            T_cl = np.ascontiguousarray(T, dtype=mc.types.np_float)
+            self._cached_T_cl = T_cl
+        matrix = target.transformation
+        if T_cl.nbytes == ctypes.sizeof(matrix):
+            # the matrix structure is a dense row-major array of mc_fp_t
+            ctypes.memmove(ctypes.addressof(matrix), T_cl.ctypes.data,
+                           T_cl.nbytes)
+        else:
+            matrix.fromarray(T)
+
+        # the fiber object is mutable - key the cache on its properties
+        fiber_key = (self._fiber.dcore, self._fiber.na, self._fiber.ncore)
+        if self._cached_fiber_key != fiber_key:
+            self._cached_core_r2 = 0.25*self._fiber.dcore**2
+            self._cached_cos_min = \
+                (1.0 - (self._fiber.na/self._fiber.ncore)**2)**0.5
+            self._cached_fiber_key = fiber_key
+        target.core_r_squared = self._cached_core_r2
+        target.cos_min = self._cached_cos_min
+
+        target.first_position.fromarray(self._get_positions()[0])
+
+        delta_key = (*direction_key, *self._orientation, self._spacing)
+        if self._cached_delta_key != delta_key:
+            delta = np.dot(T, (*(self._orientation*self._spacing), 0.0))[:2]
+            delta_squared = float(np.dot(delta, delta))
+            if delta_squared != 0.0:
+                inv_delta_squared = 1.0/delta_squared
+            else:
+                inv_delta_squared = 0.0
+            self._cached_delta = (delta, inv_delta_squared)
+            self._cached_delta_key = delta_key
+        delta, inv_delta_squared = self._cached_delta
+        target.delta_detector.fromarray(delta)
+        target.inv_delta_detector_squared = inv_delta_squared
 
         target.pl_min = self._pl_axis.scaled_start
         if self._pl_axis.step != 0.0:
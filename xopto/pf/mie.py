@@ -23,7 +23,8 @@
 from typing import Tuple
 
 import numpy as np
-from scipy.special import jv, yv
+import numba as nb
+from scipy.special import spherical_jn, spherical_yn
 
 from .pfbase import PfBase
 
@@ -188,20 +189,18 @@ def _Mie_ab(m: float or complex, x: float) -> Tuple[np.ndarray, np.ndarray]:
     nmx = int(np.round(max(nmax, np.abs(z)) + 16.0))
 
     n = np.arange(nmax)
-    nu = n + 1.5
 
-    sx = np.sqrt(0.5*np.pi*x)
-    px = sx*jv(nu, x)
+    # Riccati-Bessel functions x*j_n(x) and -x*y_n(x) of orders 1 to nmax
+    # (equal to sqrt(pi*x/2)*J_{n+1/2}(x) and -sqrt(pi*x/2)*Y_{n+1/2}(x))
+    px = x*spherical_jn(n + 1, x)
     p1x = np.hstack([np.sin(x), px[:nmax-1]])
 
-    chx = -sx*yv(nu, x)
+    chx = -x*spherical_yn(n + 1, x)
     ch1x = np.hstack([np.cos(x), chx[:nmax-1]])
     gsx = px - 1.0j*chx
     gs1x = p1x - 1.0j*ch1x
 
-    dnx = np.zeros([nmx], dtype=np.complex128)
-    for j in range(nmx, 1, -1):      # Computation of Dn(z) according to (4.89) of B+H (1983)
-        dnx[j-2] = j/z - 1.0/(dnx[j-1] + j/z)
+    dnx = _Mie_dn(complex(z), nmx)
 
 
     dn = dnx[n]          # Dn(z), n=1 to nmax
@@ -214,6 +213,32 @@ def _Mie_ab(m: float or complex, x: float) -> Tuple[np.ndarray, np.ndarray]:
     return an, bn
 
 
+@nb.jit(nopython=True, cache=True)
+def _Mie_dn(z: complex, nmx: int) -> np.ndarray:
+    '''
+    Computes the logarithmic derivative :math:`D_n(z)` by a downward
+    recurrence according to (4.89) of Bohren and Huffman (1983).
+
+    Parameters
+    ----------
+    z: complex
+        Argument :math:`z=mx` of the logarithmic derivative.
+    nmx: int
+        Starting order of the downward recurrence.
+
+    Returns
+    -------
+    dnx: np.ndarray
+        Logarithmic derivatives :math:`D_n(z)` of orders :math:`n=0`
+        to :math:`n_{mx} - 1`.
+    '''
+    dnx = np.zeros(nmx, dtype=np.complex128)
+    for j in range(nmx, 1, -1):
+        dnx[j - 2] = j/z - 1.0/(dnx[j - 1] + j/z)
+
+    return dnx
+
+
 def _Mie_pt(costheta: np.ndarray, Nmax: int) -> Tuple[np.ndarray, np.ndarray]:
     '''
     Computes pi_n and tau_n, -1 <= u <= 1, n1 integer from 1 to Nmax
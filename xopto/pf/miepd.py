@@ -32,7 +32,8 @@ from .mie import Mie
 class MiePd(PfBase):
     def __init__(self, nsphere: float or complex, nmedium: float or complex,
                  wavelength: float, pd: Callable[[float], float],
-                 drange: Tuple[float, float], nd: int = 1000):
+                 drange: Tuple[float, float], nd: int = 1000,
+                 pdpts: np.ndarray = None):
         '''
         Mie scattering phase function of an arbitrary size distribution
         of spherical particles over the specified diameter range.
@@ -59,6 +60,12 @@ class MiePd(PfBase):
             the scattering phase function at the given scattering angle cosines.
             If nd is None, an adaptive-step numerical integration is used (note
             that the computational time might increase dramatically!!!).
+        pdpts: np.ndarray
+            Optional precomputed values of the particle distribution number
+            probability density function at the nd equally spaced control
+            points, i.e. :code:`pd(np.linspace(dmin, dmax, nd))`. Can be
+            used to share the values between instances that differ only
+            in the wavelength or refractive indices. Ignored if nd is None.
 
         Note
         ----
@@ -119,7 +126,15 @@ class MiePd(PfBase):
             self._D = np.linspace(
                 float(self._drange[0]), float(self._drange[1]), self._nd)
             self._dd = (self._D[-1] - self._D[0])/(self._D.size - 1)
-            self._pdpts = self._pd(self._D)
+            if pdpts is None:
+                pdpts = self._pd(self._D)
+            pdpts = np.asarray(pdpts, dtype=np.float64)
+            if pdpts.size != self._D.size:
+                raise ValueError(
+                    'The number of precomputed particle distribution values '
+                    'must equal the number of control points nd!')
+            # a view - the shape is modified in _mie_pd
+            self._pdpts = pdpts.reshape((self._D.size,))
             self._mie = [None]*self._D.size
             G1_mie = np.zeros((self._D.size,))
             Scs_p = np.zeros((self._D.size,))
@@ -201,6 +216,20 @@ class MiePd(PfBase):
         '''
         return self._scs
 
+    def g_and_scs(self) -> Tuple[float, float]:
+        '''
+        Returns the first Legendre moment and the scattering cross section
+        that are both precalculated in the constructor.
+
+        Returns
+        -------
+        g1: float
+            The first Legendre moment of the scattering phase function.
+        scs: float
+            The scattering cross section.
+        '''
+        return self._g1, self._scs
+
     def ecs(self) -> float:
         '''
         Returns the extinction cross section.
@@ -1,5 +1,9 @@
 from typing import Callable, Tuple
+from collections import namedtuple
+import copy
+import functools
 import io
+import math
 
 from xopto import pf
 from xopto.materials import ri
@@ -12,8 +16,131 @@ import numpy as np
 
 DEFAULT_TEMPERATURE = 293.15
 
+MEMOIZE_SIZE = 256
+''' Number of memoized values of the refractive index and density models. '''
+
+SCATTERING_CACHE_SIZE = 4096
+'''
+Number of cached scattering cross sections and anisotropies of the
+suspended particles.
+'''
+
+_PI_OVER_SIX = math.pi/6.0
+_INV_FOUR_PI = 1.0/(4.0*math.pi)
+
+_Scattering = namedtuple('_Scattering', ('scs', 'g1', 'one_minus_g1'))
+''' Scattering cross section and anisotropy of the suspended particles. '''
+
+
+class _Memoized:
+    def __init__(self, fun: Callable):
+        '''
+        Memoizing adapter of a refractive index or density model. Calls with
+        unhashable arguments (e.g. numpy arrays) are passed to the model.
+        The adapter can be pickled if the model can be pickled. The memoized
+        values are not pickled.
+
+        Parameters
+        ----------
+        fun: Callable
+            Refractive index or density model.
+        '''
+        self._fun = fun
+        self._cached = functools.lru_cache(maxsize=MEMOIZE_SIZE)(fun)
+
+    def __call__(self, *args):
+        try:
+            hash(args)
+        except TypeError:
+            return self._fun(*args)
+        return self._cached(*args)
+
+    def __getstate__(self) -> dict:
+        return {'fun': self._fun}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state['fun'])
+
+
+def _memoize(fun: Callable) -> Callable:
+    '''
+    Memoizes the values of a refractive index or density model.
+    Constant and already memoized models are returned unchanged.
+
+    Parameters
+    ----------
+    fun: Callable
+        Refractive index or density model.
+
+    Returns
+    -------
+    memoized: Callable
+        Memoized model.
+    '''
+    if isinstance(fun, _Memoized) or _constant_value(fun) is not None:
+        return fun
+
+    return _Memoized(fun)
+
+
+def _constant(value: float, *args) -> float:
+    '''
+    Constant refractive index, absorption coefficient or density model
+    that ignores the wavelength and/or temperature arguments. Use with
+    :py:func:`functools.partial` to bind the value.
+
+    Parameters
+    ----------
+    value: float
+        The constant value.
+    args: tuple
+        Wavelength and/or temperature (ignored).
+
+    Returns
+    -------
+    value: float
+        The constant value.
+    '''
+    return value
+
+
+def _constant_value(model: Callable) -> float or None:
+    '''
+    Returns the value of a constant model created by binding a value to
+    :py:func:`_constant` or None if the model is not constant.
+    '''
+    if isinstance(model, functools.partial) and model.func is _constant:
+        return model.args[0]
+    return None
+
 
 class Suspension:
+    __slots__ = (
+        '_pf_cache', '_mcpf_lut_cache', '_scattering_cache',
+        '_number_density', '_nd', '_pd', '_pd_range', '_pdpts',
+        '_avg_particle_volume',
+        '_particle_ri', '_medium_ri', '_particle_mua', '_medium_mua',
+        '_particle_density', '_medium_density',
+        '_particle_ri_const', '_medium_ri_const', '_particle_mua_const',
+        '_medium_mua_const', '_particle_density_const',
+    )
+
+    wavelength_quantum = 1e-15
+    '''
+    Wavelengths (m) passed to the scattering phase functions and used as
+    the cache keys are rounded to a multiple of this value. Set to 0 to
+    disable the rounding. This is a class attribute that can only be
+    changed on the class.
+    '''
+
+    ri_digits = 12
+    '''
+    Refractive indices passed to the scattering phase functions and used as
+    the cache keys are rounded to this number of significant digits. Set to
+    None to disable the rounding. This is a class attribute that can only be
+    changed on the class.
+    '''
+
     def __init__(
             self,
             pd: Callable[[float], float] or 'Suspension',
@@ -23,7 +150,9 @@ class Suspension:
             medium_density: float or Callable[[float], float] = None,
             particle_mua: float or Callable[[float, float], float] = 0.0,
             medium_mua: float or Callable[[float, float], float] = 0.0,
-            solid_content: float = 10.0, nd: int or None = 100):
+            solid_content: float = 10.0, nd: int or None = 100,
+            pf_cache_size: int or None = 128,
+            mcpf_cache_size: int or None = 32):
         '''
         Suspension of spherical particles that follows the provided size
         distribution function.
@@ -94,6 +223,18 @@ class Suspension:
             the Mie scattering phase function over the range of the size
             distribution `pd`.
             If None, adaptive step integration is used (slow).
+        pf_cache_size: int or None
+            Maximum number of scattering phase functions kept in the cache.
+            The least recently used scattering phase functions are removed
+            from a full cache. If None, the size of the cache is not limited.
+            Ignored when creating a copy of a suspension, which shares the
+            cache of the original suspension.
+        mcpf_cache_size: int or None
+            Maximum number of Monte Carlo lookup table-based scattering phase
+            functions kept in the cache. The least recently used lookup
+            tables are removed from a full cache. If None, the size of the
+            cache is not limited. Ignored when creating a copy of a
+            suspension, which shares the cache of the original suspension.
 
         Note
         ----
@@ -122,11 +263,18 @@ class Suspension:
             medium_mua = obj._medium_mua
             solid_content = obj.solid_content(293.15)
             nd = obj._nd
+            avg_particle_volume = obj._avg_particle_volume
+            pdpts = obj._pdpts
             self._pf_cache = obj._pf_cache
             self._mcpf_lut_cache = obj._mcpf_lut_cache
+            self._scattering_cache = obj._scattering_cache
         else:
-            self._pf_cache = cache.ObjCache()
-            self._mcpf_lut_cache = cache.LutCache()
+            avg_particle_volume = None
+            pdpts = None
+            self._pf_cache = cache.ObjCache(maxsize=pf_cache_size)
+            self._mcpf_lut_cache = cache.LutCache(maxsize=mcpf_cache_size)
+            self._scattering_cache = cache.ObjCache(
+                maxsize=SCATTERING_CACHE_SIZE)
 
         if nd is not None:
             nd = int(nd)
@@ -147,28 +295,30 @@ class Suspension:
             medium_density = density.water.default
 
         if isinstance(particle_ri, (float, int)):
-            particle_ri_value = float(particle_ri)
-            particle_ri = lambda w, t: particle_ri_value
+            particle_ri = functools.partial(_constant, float(particle_ri))
+        else:
+            particle_ri = _memoize(particle_ri)
 
         if isinstance(medium_ri, (float, int)):
-            medium_ri_value = float(medium_ri)
-            medium_ri = lambda w, t: medium_ri_value
+            medium_ri = functools.partial(_constant, float(medium_ri))
+        else:
+            medium_ri = _memoize(medium_ri)
 
         if isinstance(particle_mua, (float, int)):
-            particle_mua_value = float(particle_mua)
-            particle_mua = lambda w, t: particle_mua_value
+            particle_mua = functools.partial(_constant, float(particle_mua))
 
         if isinstance(medium_mua, (float, int)):
-            medium_mua_value = float(medium_mua)
-            medium_mua = lambda w, t: medium_mua_value
+            medium_mua = functools.partial(_constant, float(medium_mua))
 
         if isinstance(particle_density, (float, int)):
-            particle_density_value = float(particle_density)
-            particle_density = lambda t: particle_density_value
+            particle_density = functools.partial(
+                _constant, float(particle_density))
+        else:
+            particle_density = _memoize(particle_density)
 
         if isinstance(medium_density, (float, int)):
-            medium_density_value = float(medium_density)
-            medium_density = lambda t: medium_density_value
+            medium_density = functools.partial(
+                _constant, float(medium_density))
 
         self._particle_ri = particle_ri
         self._medium_ri = medium_ri
@@ -178,9 +328,43 @@ class Suspension:
         self._medium_density = medium_density
         self._pd = pd
 
+        # constant models are used directly, without calling the model
+        self._particle_ri_const = _constant_value(particle_ri)
+        self._medium_ri_const = _constant_value(medium_ri)
+        self._particle_mua_const = _constant_value(particle_mua)
+        self._medium_mua_const = _constant_value(medium_mua)
+        self._particle_density_const = _constant_value(particle_density)
+
+        # the distribution does not change - freeze the range (a cache key
+        # component that some distributions rebuild on each access)
+        drange = self._pd.range
+        self._pd_range = (float(drange[0]), float(drange[1]))
+
+        # compute the moment only once
+        if avg_particle_volume is None:
+            avg_particle_volume = _PI_OVER_SIX*float(self._pd.raw_moment(3))
+        self._avg_particle_volume = avg_particle_volume
+
+        # the distribution at the integration nodes of MiePd is also fixed
+        if pdpts is None and nd is not None:
+            pdpts = np.asarray(self._pd(np.linspace(
+                self._pd_range[0], self._pd_range[1], nd)), dtype=np.float64)
+        self._pdpts = pdpts
+
         # this will initialize self._number_density
         self.set_solid_content(solid_content, 293.15)
 
+    def __copy__(self) -> 'Suspension':
+        '''
+        Returns a shallow copy of this suspension that shares the models,
+        size distribution, precomputed values and caches with this suspension.
+        Unlike the copy constructor, the constructor is not called.
+        '''
+        obj = Suspension.__new__(type(self))
+        for name in Suspension.__slots__:
+            setattr(obj, name, getattr(self, name))
+        return obj
+
     def set_musr(self, musr: float, wavelength: float,
                  temperature: float = 293.15):
         '''
@@ -198,9 +382,8 @@ class Suspension:
         temperature: float
             Suspension temperature (K).
         '''
-        pf_obj = self.pf(wavelength, temperature)
-        g, scs = pf_obj.g(1), pf_obj.scs()
-        self._number_density = musr/(1.0 - g)/scs
+        scattering = self._scattering(wavelength, temperature)
+        self._number_density = musr/scattering.one_minus_g1/scattering.scs
 
     def set_mus(self, mus: float, wavelength: float,
                 temperature: float = 293.15):
@@ -218,7 +401,8 @@ class Suspension:
         temperature: float
             Suspension temperature (K).
         '''
-        self._number_density = mus/self.pf(wavelength, temperature).scs()
+        self._number_density = \
+            mus/self._scattering(wavelength, temperature).scs
 
     def set_number_density(self, nd: float):
         '''
@@ -251,9 +435,10 @@ class Suspension:
         Solid content of 1% wt/v equals 1 g/100 ml, which equals 10 g/l or
         10 kg/m3. 
         '''
-        average_particle_volume = np.pi/6.0*self._pd.raw_moment(3)
-        average_particle_weight = \
-            average_particle_volume*self._particle_density(temperature)
+        particle_density = self._particle_density_const
+        if particle_density is None:
+            particle_density = self._particle_density(temperature)
+        average_particle_weight = self._avg_particle_volume*particle_density
         # 1 % g/ml ~ 0.01 g/ml ~ 10 g/l ~ 10 kg/m3
         self._number_density = sc*10.0/average_particle_weight
 
@@ -367,8 +552,8 @@ class Suspension:
             Scattering coefficient (1/m) of the suspension
             at the given wavelength and temperature.
         '''
-        pf_obj = self.pf(wavelength, temperature)
-        return self.number_density()*pf_obj.scs()
+        return self.number_density()*\
+            self._scattering(wavelength, temperature).scs
 
     def musr(self, wavelength: float, temperature: float = 293.15) -> float:
         '''
@@ -388,8 +573,8 @@ class Suspension:
             Reduced scattering coefficient (1/m) of the suspension
             at the given wavelength and temperature.
         '''
-        g = self.g(wavelength, temperature)
-        return self.mus(wavelength, temperature)*(1.0 - g)
+        scattering = self._scattering(wavelength, temperature)
+        return self.number_density()*scattering.scs*scattering.one_minus_g1
 
     def particle_volume_fraction(self, temperature: float = 293.15) -> float:
         '''
@@ -414,8 +599,10 @@ class Suspension:
         :py:meth:`Suspension.medium_volume_fraction` sum up to 1 if computed
         at the same temperature.
         '''
-        return self.solid_content(temperature)*10.0/ \
-            self._particle_density(temperature)
+        particle_density = self._particle_density_const
+        if particle_density is None:
+            particle_density = self._particle_density(temperature)
+        return self.solid_content(temperature)*10.0/particle_density
 
     def medium_volume_fraction(self, temperature: float = 293.15) -> float:
         '''
@@ -474,12 +661,24 @@ class Suspension:
         Solid content of 1% wt/v equals 1 g/100 ml, which equals 10 g/l or
         10 kg/m3.
         '''
-        average_particle_volume = np.pi/6.0*self._pd.raw_moment(3)
-        average_particle_weight = \
-            average_particle_volume*self._particle_density(temperature)
+        particle_density = self._particle_density_const
+        if particle_density is None:
+            particle_density = self._particle_density(temperature)
+        average_particle_weight = self._avg_particle_volume*particle_density
         # kg/m3 ~ g/l ~ 0.001 g/ml ~ 0.1 % g/ml
         return self.number_density()*average_particle_weight*0.1
 
+    def _pf_from_args(self, args: tuple) -> pf.MiePd:
+        '''
+        Returns the cached pf.MiePd instance created with the given arguments.
+        A new instance is created from the precomputed values of the size
+        distribution if one is not found in the cache.
+        '''
+        if not self._pf_cache.contains(pf.MiePd, *args):
+            self._pf_cache.insert(
+                pf.MiePd(*args, pdpts=self._pdpts), pf.MiePd, *args)
+        return self._pf_cache.get(pf.MiePd, *args)
+
     def pf(self, wavelength: float, temperature: float = 293.15) -> pf.MiePd:
         '''
         Computes and returns an instance of the scattering phase function
@@ -499,18 +698,56 @@ class Suspension:
             Scattering phase function instance at the given wavelength
             and temperature.
         '''
+        return self._pf_from_args(self._pf_args(wavelength, temperature))
+
+    def _quantize_ri(self, value: float) -> float:
+        if self.ri_digits is None:
+            return value
+        value = float(value)
+        if value == 0.0 or not math.isfinite(value):
+            return value
+        return round(value, int(self.ri_digits) - 1 -
+                     math.floor(math.log10(abs(value))))
+
+    def _pf_args(self, wavelength: float, temperature: float = 293.15) \
+            -> tuple:
+        '''
+        Arguments of the pf.MiePd scattering phase function at the given
+        wavelength and temperature. The wavelength and the refractive indices
+        are rounded as set by the :py:attr:`Suspension.wavelength_quantum` and
+        :py:attr:`Suspension.ri_digits` attributes, so that the arguments
+        of nearly equal queries hit the same cache entry. All the numeric
+        arguments are plain Python scalars, hence :py:meth:`Suspension.pf`
+        and :py:meth:`Suspension.mcpf` produce equal cache keys.
+        '''
         nd = int(self._nd) if self._nd is not None else None
-        return self._pf_cache.get(
-            pf.MiePd,
-            float(self._particle_ri(wavelength, temperature)) +
-                1j*float(self._particle_mua(wavelength, temperature))*
-                    wavelength/(4.0*np.pi),
-            float(self._medium_ri(wavelength, temperature)) +
-                1j*float(self._medium_mua(wavelength, temperature))*
-                    wavelength/(4.0*np.pi),
-            float(wavelength),
-            self._pd, self._pd.range, nd
-        )
+        # plain float arithmetic from here on (avoids numpy scalar dispatch)
+        wavelength = float(wavelength)
+        temperature = float(temperature)
+        particle_ri = self._particle_ri_const
+        if particle_ri is None:
+            particle_ri = float(self._particle_ri(wavelength, temperature))
+        particle_mua = self._particle_mua_const
+        if particle_mua is None:
+            particle_mua = float(self._particle_mua(wavelength, temperature))
+        medium_ri = self._medium_ri_const
+        if medium_ri is None:
+            medium_ri = float(self._medium_ri(wavelength, temperature))
+        medium_mua = self._medium_mua_const
+        if medium_mua is None:
+            medium_mua = float(self._medium_mua(wavelength, temperature))
+
+        nsphere = particle_ri + 1j*particle_mua*wavelength*_INV_FOUR_PI
+        nmedium = medium_ri + 1j*medium_mua*wavelength*_INV_FOUR_PI
+        nsphere = complex(self._quantize_ri(nsphere.real),
+                          self._quantize_ri(nsphere.imag))
+        nmedium = complex(self._quantize_ri(nmedium.real),
+                          self._quantize_ri(nmedium.imag))
+        if self.wavelength_quantum:
+            wavelength = round(wavelength/self.wavelength_quantum)* \
+                self.wavelength_quantum
+
+        return nsphere, nmedium, wavelength, self._pd, self._pd_range, nd
 
     def mcpf(self, wavelength: float, temperature: float = 293.15) \
             -> xopto.mcbase.mcpf.PfBase:
@@ -530,20 +767,12 @@ class Suspension:
             Monte Carlo simulator-compatible scattering phase function
             instance at the given wavelength and temperature.
         '''
-        nd = int(self._nd) if self._nd is not None else None
-        return self._mcpf_lut_cache.get(
-            pf.MiePd,
-            (
-                float(self._particle_ri(wavelength, temperature)) + 
-                    1j*float(self._particle_mua(wavelength, temperature))*
-                        wavelength/(4.0*np.pi),
-                float(self._medium_ri(wavelength, temperature)) +
-                    1j*float(self._medium_mua(wavelength, temperature))*
-                        wavelength/(4.0*np.pi),
-                float(wavelength),
-                self._pd, self._pd.range, nd
-            )
-        )
+        args = self._pf_args(wavelength, temperature)
+        pf_obj = None
+        if not self._mcpf_lut_cache.contains(pf.MiePd, args):
+            # compute the lookup table from the (cached) phase function of pf
+            pf_obj = self._pf_from_args(args)
+        return self._mcpf_lut_cache.get(pf.MiePd, args, pf_obj=pf_obj)
 
     def scs(self, wavelength: float, temperature: float = 293.15) -> float:
         '''
@@ -563,7 +792,7 @@ class Suspension:
             Scattering cross section (m2) of the suspended particles
             at the given wavelength and temperature.
         '''
-        return self.pf(wavelength, temperature).scs()
+        return self._scattering(wavelength, temperature).scs
 
     def g(self, wavelength: float, temperature: float = 293.15, n: int = 1):
         '''
@@ -588,8 +817,139 @@ class Suspension:
             phase function that describes the scattering of
             the suspended particles at the given wavelength and temperature.
         '''
+        if n == 1:
+            return self._scattering(wavelength, temperature).g1
+
         return self.pf(wavelength, temperature).g(n)
 
+    def _scattering(self, wavelength: float, temperature: float = 293.15) \
+            -> _Scattering:
+        '''
+        Returns the scattering cross section and anisotropy of the suspended
+        particles at the given wavelength and temperature. The values are
+        cached under the rounded arguments of the scattering phase function,
+        so that repeated queries skip the scattering phase function.
+        '''
+        args = self._pf_args(wavelength, temperature)
+        if not self._scattering_cache.contains(_Scattering, *args):
+            g1, scs = self._pf_from_args(args).g_and_scs()
+            self._scattering_cache.insert(
+                _Scattering(scs, g1, 1.0 - g1), _Scattering, *args)
+
+        return self._scattering_cache.get(_Scattering, *args)
+
+    def _pf_spectrum(self, wavelengths: np.ndarray,
+                     temperature: float = 293.15) -> list:
+        '''
+        Returns a list of scattering phase function instances, one for each
+        of the given wavelengths.
+        '''
+        return [self.pf(float(w), temperature)
+                for w in np.asarray(wavelengths, dtype=np.float64).flat]
+
+    def scs_spectrum(self, wavelengths: np.ndarray,
+                     temperature: float = 293.15) -> np.ndarray:
+        '''
+        Computes the scattering cross section of the suspended particles
+        at the given wavelengths and temperature.
+
+        Parameters
+        -----------
+        wavelengths: np.ndarray
+            Wavelengths of light (m).
+        temperature: float
+            Suspension temperature (K).
+
+        Returns
+        -------
+        scs: np.ndarray
+            Scattering cross sections (m2) of the suspended particles
+            at the given wavelengths.
+        '''
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        scs = np.fromiter(
+            (self._scattering(w, temperature).scs for w in wavelengths.flat),
+            dtype=np.float64, count=wavelengths.size)
+        return scs.reshape(wavelengths.shape)
+
+    def g_spectrum(self, wavelengths: np.ndarray,
+                   temperature: float = 293.15, n: int = 1) -> np.ndarray:
+        '''
+        Computes the specified Legendre moment of the scattering phase
+        function of the suspended particles at the given wavelengths and
+        temperature.
+
+        Parameters
+        -----------
+        wavelengths: np.ndarray
+            Wavelengths of light (m).
+        temperature: float
+            Suspension temperature (K).
+        n: int
+            Legendre moment (defaults to 1 - anisotropy of the scattering
+            phase function).
+
+        Returns
+        -------
+        g: np.ndarray
+            The specified Legendre moment of the scattering phase function
+            at the given wavelengths.
+        '''
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        g = np.fromiter(
+            (pf_obj.g(n) for pf_obj in
+             self._pf_spectrum(wavelengths, temperature)),
+            dtype=np.float64, count=wavelengths.size)
+        return g.reshape(wavelengths.shape)
+
+    def mus_spectrum(self, wavelengths: np.ndarray,
+                     temperature: float = 293.15) -> np.ndarray:
+        '''
+        Computes the scattering coefficient of the suspension at
+        the given wavelengths and temperature.
+
+        Parameters
+        ----------
+        wavelengths: np.ndarray
+            Wavelengths of light (m).
+        temperature: float
+            Suspension temperature (K).
+
+        Returns
+        -------
+        mus: np.ndarray
+            Scattering coefficient (1/m) of the suspension
+            at the given wavelengths.
+        '''
+        return self.number_density()*\
+            self.scs_spectrum(wavelengths, temperature)
+
+    def musr_spectrum(self, wavelengths: np.ndarray,
+                      temperature: float = 293.15) -> np.ndarray:
+        '''
+        Computes the reduced scattering coefficient of the suspension at
+        the given wavelengths and temperature.
+
+        Parameters
+        ----------
+        wavelengths: np.ndarray
+            Wavelengths of light (m).
+        temperature: float
+            Suspension temperature (K).
+
+        Returns
+        -------
+        musr: np.ndarray
+            Reduced scattering coefficient (1/m) of the suspension
+            at the given wavelengths.
+        '''
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        scs_musr = np.fromiter(
+            (scattering.scs*scattering.one_minus_g1 for scattering in
+             (self._scattering(w, temperature) for w in wavelengths.flat)),
+            dtype=np.float64, count=wavelengths.size)
+        return (self.number_density()*scs_musr).reshape(wavelengths.shape)
+
     def particle_ri(self, wavelength: float,
                     temperature: float = 293.15) -> float:
         '''
@@ -692,6 +1052,38 @@ class Suspension:
         '''
         return self._medium_density(temperature)
 
+    def _diluted_number_density_mus(self, mus: float, wavelength: float,
+                                    temperature: float) -> float:
+        '''
+        Number density of particles in a dilution of this suspension that
+        has the given scattering coefficient (1/m) at the given wavelength
+        (m) and temperature (K). Raises ValueError if the scattering
+        coefficient exceeds the value of this suspension.
+        '''
+        scs = self._scattering(wavelength, temperature).scs
+        if mus > self._number_density*scs:
+            raise ValueError(
+                'The scattering coefficient of the diluted '
+                'suspension exceeds the value of this suspension!')
+
+        return mus/scs
+
+    def _diluted_number_density_musr(self, musr: float, wavelength: float,
+                                     temperature: float) -> float:
+        '''
+        Number density of particles in a dilution of this suspension that
+        has the given reduced scattering coefficient (1/m) at the given
+        wavelength (m) and temperature (K). Raises ValueError if the reduced
+        scattering coefficient exceeds the value of this suspension.
+        '''
+        scattering = self._scattering(wavelength, temperature)
+        if musr > self._number_density*scattering.scs*scattering.one_minus_g1:
+            raise ValueError(
+                'The reduced scattering coefficient of the diluted '
+                'suspension exceeds the value of this suspension!')
+
+        return musr/scattering.one_minus_g1/scattering.scs
+
     def make_mus(self, mus: float, volume: float,
                  wavelength: float, temperature: float = 293.15) \
                     -> Tuple[float, 'Suspension']:
@@ -718,18 +1110,62 @@ class Suspension:
         diluted_suspension: Suspension
             Diluted suspension.
         '''
-        if mus > self.mus(wavelength, temperature):
+        nd = self._diluted_number_density_mus(mus, wavelength, temperature)
+
+        diluted_suspension = copy.copy(self)
+        diluted_suspension.set_number_density(nd)
+        # only the number density changes - the solid content is proportional
+        required_volume = volume*nd/self._number_density
+
+        return required_volume, diluted_suspension
+
+    def make_mus_series(self, mus: np.ndarray, volume: float,
+                        wavelength: float, temperature: float = 293.15) \
+                            -> Tuple[np.ndarray, list]:
+        '''
+        Compute the volumes that need to be taken from this suspension to
+        prepare a series of diluted suspensions with target volume and
+        target scattering coefficients at the given wavelength and
+        temperature. The scattering phase function is computed only once
+        for the entire series.
+
+        Parameters
+        ----------
+        mus: np.ndarray
+            Target scattering coefficients (1/m) of the diluted suspensions.
+        volume: float
+            Volume of each target suspension (m3).
+        wavelength: float
+            Wavelength of light (m).
+        temperature: float
+            Suspension temperature (K).
+
+        Returns
+        -------
+        required_volumes: np.ndarray
+            The required volumes of this suspension (m3), one for each
+            target scattering coefficient.
+        diluted_suspensions: list[Suspension]
+            Diluted suspensions, one for each target scattering coefficient.
+        '''
+        mus = np.asarray(mus, dtype=np.float64)
+        scs = self._scattering(wavelength, temperature).scs
+        if mus.size and np.max(mus) > self._number_density*scs:
             raise ValueError(
                 'The scattering coefficient of the diluted '
                 'suspension exceeds the value of this suspension!')
 
-        diluted_suspension = Suspension(self)
-        diluted_suspension.set_mus(mus, wavelength, temperature)
-        # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
-        solid_mass = diluted_suspension.solid_content(temperature)*10.0*volume
-        required_volume = solid_mass/(self.solid_content(temperature)*10.0)
+        nds = mus/scs
+        # only the number density changes - the solid content is proportional
+        required_volumes = volume*nds/self._number_density
 
-        return required_volume, diluted_suspension
+        diluted_suspensions = []
+        for nd in nds.flat:
+            diluted_suspension = copy.copy(self)
+            diluted_suspension.set_number_density(float(nd))
+            diluted_suspensions.append(diluted_suspension)
+
+        return required_volumes, diluted_suspensions
 
     def make_mus_from(self, mus: float, volume: float,
                       wavelength: float, temperature: float = 293.15) \
@@ -758,17 +1194,12 @@ class Suspension:
         diluted_suspension: Suspension
             Diluted suspension.
         '''
-        if mus > self.mus(wavelength, temperature):
-            raise ValueError(
-                'The scattering coefficient of the diluted '
-                'suspension exceeds the value of this suspension!')
+        nd = self._diluted_number_density_mus(mus, wavelength, temperature)
 
-        diluted_suspension = Suspension(self)
-        diluted_suspension.set_mus(mus, wavelength, temperature)
-        # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
-        solid_mass = self.solid_content(temperature)*10.0*volume
-        total_volume = \
-            solid_mass/(diluted_suspension.solid_content(temperature)*10.0)
+        diluted_suspension = copy.copy(self)
+        diluted_suspension.set_number_density(nd)
+        # only the number density changes - the solid content is proportional
+        total_volume = volume*self._number_density/nd
 
         return total_volume, diluted_suspension
 
@@ -799,16 +1230,12 @@ class Suspension:
         diluted_suspension: Suspension
             Diluted suspension.
         '''
-        if musr > self.musr(wavelength, temperature):
-            raise ValueError(
-                'The reduced scattering coefficient of the diluted '
-                'suspension exceeds the value of this suspension!')
+        nd = self._diluted_number_density_musr(musr, wavelength, temperature)
 
-        diluted_suspension = Suspension(self)
-        diluted_suspension.set_musr(musr, wavelength, temperature)
-        # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
-        solid_mass = diluted_suspension.solid_content(temperature)*10.0*volume
-        required_volume = solid_mass/(self.solid_content(temperature)*10.0)
+        diluted_suspension = copy.copy(self)
+        diluted_suspension.set_number_density(nd)
+        # only the number density changes - the solid content is proportional
+        required_volume = volume*nd/self._number_density
 
         return required_volume, diluted_suspension
 
@@ -840,17 +1267,12 @@ class Suspension:
         diluted_suspension: Suspension
             Diluted suspension.
         '''
-        if musr > self.musr(wavelength, temperature):
-            raise ValueError(
-                'The reduced scattering coefficient of the diluted '
-                'suspension exceeds the value of this suspension!')
+        nd = self._diluted_number_density_musr(musr, wavelength, temperature)
 
-        diluted_suspension = Suspension(self)
-        diluted_suspension.set_musr(musr, wavelength, temperature)
-        # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
-        solid_mass = self.solid_content(temperature)*10.0*volume
-        total_volume = \
-            solid_mass/(diluted_suspension.solid_content(temperature)*10.0)
+        diluted_suspension = copy.copy(self)
+        diluted_suspension.set_number_density(nd)
+        # only the number density changes - the solid content is proportional
+        total_volume = volume*self._number_density/nd
 
         return total_volume, diluted_suspension
 
@@ -885,7 +1307,7 @@ class Suspension:
                 'The solid content of the diluted '
                 'suspension exceeds the solid content of this suspension!')
 
-        diluted_suspension = Suspension(self)
+        diluted_suspension = copy.copy(self)
         diluted_suspension.set_solid_content(solid_content, temperature)
         # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
         solid_mass = solid_content*10.0*volume
@@ -924,7 +1346,7 @@ class Suspension:
                 'The solid content of the diluted '
                 'suspension exceeds the solid content of this suspension!')
 
-        diluted_suspension = Suspension(self)
+        diluted_suspension = copy.copy(self)
         diluted_suspension.set_solid_content(solid_content, temperature)
         # solid content units % wt/v or 1 g/100 ml or 10 g/l or 10 kg/m3
         solid_mass = solid_content*10.0*volume
@@ -961,7 +1383,7 @@ class Suspension:
         solid_mass = self.solid_content(temperature)*10.0*take
         diluted_solid_content = solid_mass/(dilute*10.0)
 
-        diluted_suspension = Suspension(self)
+        diluted_suspension = copy.copy(self)
         diluted_suspension.set_solid_content(diluted_solid_content, temperature)
 
         return diluted_suspension
@@ -1220,8 +1642,8 @@ class Suspension:
                 self._pf_cache.save(fid)
                 self._mcpf_lut_cache.save(fid)
         else:
-            self._pf_cache.save(fid)
-            self._mcpf_lut_cache.save(fid)
+            self._pf_cache.save(filename)
+            self._mcpf_lut_cache.save(filename)
 
     def load_cache(self, filename: str or io.IOBase):
         '''
@@ -1241,11 +1663,25 @@ class Suspension:
 
         if isinstance(filename, str):
             with open(filename, 'rb') as fid:
-                self._pf_cache = cache.ObjCache.load(fid)
-                self._mcpf_lut_cache = cache.LutCache.load(fid)
+                self._pf_cache = cache.ObjCache.load(
+                    fid, maxsize=self._pf_cache.maxsize())
+                self._mcpf_lut_cache = cache.LutCache.load(
+                    fid, maxsize=self._mcpf_lut_cache.maxsize())
         else:
-            self._pf_cache = cache.ObjCache.load(fid)
-            self._mcpf_lut_cache = cache.LutCache.load(fid)
+            self._pf_cache = cache.ObjCache.load(
+                filename, maxsize=self._pf_cache.maxsize())
+            self._mcpf_lut_cache = cache.LutCache.load(
+                filename, maxsize=self._mcpf_lut_cache.maxsize())
+
+    def clear_caches(self):
+        '''
+        Removes all the scattering phase functions, Monte Carlo lookup
+        tables and cached scattering properties from the caches. Note that
+        the caches are shared with the copies of this suspension.
+        '''
+        self._pf_cache.clear()
+        self._mcpf_lut_cache.clear()
+        self._scattering_cache.clear()
 
     def _get_cache(self) -> Tuple[cache.ObjCache, cache.LutCache]:
         return self._pf_cache, self._mcpf_lut_cache